@@ -12,6 +12,7 @@ Unlike Pydantic models (which handle data validation), SQLAlchemy models:
 # Import SQLAlchemy components for database modeling
 from sqlalchemy.ext.declarative import declarative_base  # Base class for all models
 from sqlalchemy import Column, Integer, String, Float    # Column types for table definition
+from sqlalchemy import Index                             # Composite (multi-column) index definition
 
 # Create base class for all database models
 # All SQLAlchemy models inherit from this Base class
@@ -44,11 +45,18 @@ class Product(Base):
     # Define the table name in the database
     # This will create a table called 'product' in MySQL/MariaDB
     __tablename__ = 'product'
+
+    # Composite index on (name, price)
+    # Queries that only need name and price are answered from the index alone.
+    # Plain name lookups use the unique index on the name column below.
+    __table_args__ = (
+        Index('ix_product_name_price', 'name', 'price'),
+    )
     
     # Define table columns with their types and constraints
     # Each Column maps to a database column with specific properties
     id = Column(Integer, primary_key=True, index=True)  # Primary key with automatic indexing
-    name = Column(String(255))        # Product name (max 255 characters for MySQL compatibility)
+    name = Column(String(191), unique=True, index=True, nullable=False)  # Unique product name (191 chars keeps the index within InnoDB's utf8mb4 key limit)
     description = Column(String(255)) # Product description (max 255 characters)
     price = Column(Float)             # Product price (floating point number)
     quantity = Column(Integer)        # Available quantity (integer)
@@ -56,7 +64,10 @@ class Product(Base):
     # Detailed column explanations:
     # - primary_key=True: Makes this column the unique identifier and auto-incrementing
     # - index=True: Creates database index for faster lookups and queries
+    # - unique=True (with index=True): Makes that index UNIQUE, so MySQL rejects duplicate names and
+    #   INSERT ... ON DUPLICATE KEY UPDATE can upsert a product by name in a single statement
     # - String(255): MySQL/MariaDB requires length specification for VARCHAR columns
+    # - String(191): 191 x 4 bytes (utf8mb4) fits the 767-byte index key limit of older InnoDB row formats
     # - Float: Allows decimal numbers for pricing (supports currency values)
     # - Integer: Whole numbers for quantities and IDs (no decimal places)
     
@@ -66,3 +77,10 @@ class Product(Base):
     # - default=value: Set default values
     # - ForeignKey: Create relationships between tables
     # - CheckConstraint: Add validation rules at database level
+
+    # Migrating an existing database:
+    # create_all() only creates missing tables, it never alters existing ones, so run once:
+    #   ALTER TABLE product MODIFY name VARCHAR(191) NOT NULL,
+    #     ADD UNIQUE INDEX ix_product_name (name),
+    #     ADD INDEX ix_product_name_price (name, price);
+    # (remove or rename any rows with duplicate names first)
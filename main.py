@@ -8,38 +8,165 @@
 ###############
 
 # Import necessary modules for FastAPI application
-from fastapi import FastAPI, Depends  # FastAPI framework and dependency injection
-from models import Product   # Import our Pydantic Product model for data validation
-from config import session, engine  # Import database session and engine from config
+import os  # For reading the allowed CORS origins from the environment
+import asyncio  # Runs the periodic connection pool status logger
+import logging  # Logs connection pool status alongside uvicorn's own messages
+import time  # Monotonic clock for the product list cache TTL
+import hashlib  # Hashes cached response bodies into ETags
+from contextlib import asynccontextmanager  # Builds the application lifespan handler
+from typing import Union  # Response models for endpoints that return a product or a message
+from fastapi import FastAPI, Depends, Body, Request, Response  # FastAPI framework and dependency injection
+from fastapi.responses import PlainTextResponse  # Plain text response for the greeting endpoint
+from pydantic import TypeAdapter  # Serializes the product list to JSON bytes for the cache
+from models import Product, ProductOut, ProductListItem   # Import our Pydantic models for data validation
+from config import get_sessionmaker, get_engine, request_queries  # Import cached session factory, engine and per-request query log from config
 import db_models  # Import SQLAlchemy database models
-from sqlalchemy.orm import Session  # SQLAlchemy session type for dependency injection
+from sqlalchemy import select, exists, update, delete, lambda_stmt  # Builds SELECT / EXISTS / UPDATE / DELETE statements for async execution
+from sqlalchemy.dialects.mysql import insert as mysql_insert  # MySQL INSERT with ON DUPLICATE KEY UPDATE support
+from sqlalchemy.ext.asyncio import AsyncSession  # Async SQLAlchemy session type for dependency injection
+from sqlalchemy.exc import DBAPIError, IntegrityError  # Raised for database errors such as "table already exists" / duplicate keys
+from sqlalchemy.orm import raiseload  # Loader option that forbids implicit lazy loading
 from fastapi.middleware.cors import CORSMiddleware  # CORS middleware for frontend integration
+
+# Logger shared with uvicorn so messages show up in the server output
+logger = logging.getLogger("uvicorn.error")
+
+# Seconds between connection pool status log lines (0 disables it)
+DB_POOL_STATUS_INTERVAL = float(os.environ.get('DB_POOL_STATUS_INTERVAL', 60))
+
+async def log_pool_status(interval: float):
+    """
+    Periodically log the connection pool status.
+    A checked-out count that keeps growing while traffic is flat points to
+    sessions that are never closed (a connection leak).
+    Args:
+        interval (float): Seconds to wait between log lines
+    """
+    while True:
+        await asyncio.sleep(interval)
+        logger.info("DB pool status: %s", get_engine().pool.status())
+
+async def create_tables():
+    """
+    Create any missing tables defined in db_models.
+    With several workers starting together, two can both see a table missing and both issue
+    CREATE TABLE; the slower one then fails with "table already exists". In that case the
+    tables were just created by the other worker, so create_all is run once more, which now
+    finds them and does nothing. A second failure is a real error and is raised.
+    """
+    # create_all is a synchronous metadata API, so it's executed through run_sync on the async connection
+    try:
+        async with get_engine().begin() as conn:
+            await conn.run_sync(db_models.Base.metadata.create_all)
+    except DBAPIError as e:
+        logger.warning("Table creation raced with another worker, retrying: %s", e)
+        async with get_engine().begin() as conn:
+            await conn.run_sync(db_models.Base.metadata.create_all)
+
+# Application lifespan: code before `yield` runs once at startup, code after it at shutdown
+# Table creation and sample seeding happen here instead of at import time, so importing
+# main doesn't touch the database and the event loop is running before any DB work starts.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await create_tables()
+    await init_db()
+    pool_status_task = None
+    if DB_POOL_STATUS_INTERVAL > 0:
+        pool_status_task = asyncio.create_task(log_pool_status(DB_POOL_STATUS_INTERVAL))
+    yield
+    if pool_status_task:
+        pool_status_task.cancel()
+    await get_engine().dispose()  # Close pooled connections on shutdown
+
 # Create FastAPI application instance
 # This is the main application object that will handle all HTTP requests
-app = FastAPI()
+# Every endpoint declares a response_model: FastAPI then serializes the result straight
+# to JSON bytes with Pydantic's compiled serializer instead of the slower jsonable_encoder
+app = FastAPI(lifespan=lifespan)
+
+# Allowed frontend origins, parsed once at startup
+# Comma-separated in .env (CORS_ORIGINS), defaulting to the React development server
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',')
+    if origin.strip()
+]
 
 # Add CORS middleware to allow frontend (React) to communicate with backend
 # CORS (Cross-Origin Resource Sharing) allows requests from different origins
+# Methods and headers are listed explicitly instead of "*", so only what the API uses is allowed.
+# Requests without an Origin header (same-origin, curl, health checks) pass straight through.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000"],  # Allow React development server
-    allow_methods=["*"]  # Allow all HTTP methods (GET, POST, PUT, DELETE)
+    allow_origins=CORS_ORIGINS,  # Allow React development server (or origins from .env)
+    allow_methods=["GET", "POST", "PUT", "DELETE"],  # HTTP methods used by the product endpoints
+    allow_headers=["content-type", "authorization"]  # Needed for JSON request bodies and auth headers
 )
 
-# Create all database tables based on SQLAlchemy models
-# This line ensures that all tables defined in db_models are created in the database
-# if they don't already exist. It's called at application startup.
-db_models.Base.metadata.create_all(bind=engine)
+# Per-request SQL query counting, for development, tests and CI (off by default)
+# Enable with DB_QUERY_COUNT=true. Each response then carries an X-DB-Query-Count header,
+# and a warning is logged when a request runs more than DB_QUERY_BUDGET queries
+# (0 disables the warning). Every endpoint here needs at most a couple of queries;
+# more usually means an N+1 query pattern.
+DB_QUERY_COUNT = os.environ.get('DB_QUERY_COUNT', 'false').lower() == 'true'
+DB_QUERY_BUDGET = int(os.environ.get('DB_QUERY_BUDGET', 10))
+
+class QueryCountMiddleware:
+    """
+    ASGI middleware that counts the SQL queries each HTTP request runs.
+    The engine's before_cursor_execute listener (config.record_query) appends to the
+    list set here. Written as plain ASGI rather than @app.middleware("http"), which
+    would wrap every request in Starlette's much slower BaseHTTPMiddleware machinery.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = []
+        token = request_queries.set(queries)
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                # Build a new headers list so the response object's own headers aren't modified
+                headers = [*message.get("headers", []), (b"x-db-query-count", str(len(queries)).encode())]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            request_queries.reset(token)
+        if DB_QUERY_BUDGET and len(queries) > DB_QUERY_BUDGET:
+            logger.warning(
+                "%s %s ran %d SQL queries (budget %d)",
+                scope["method"], scope["path"], len(queries), DB_QUERY_BUDGET,
+            )
+
+if DB_QUERY_COUNT:
+    app.add_middleware(QueryCountMiddleware)
 
 # Define a simple GET endpoint at the root path "/"
 # When someone visits the base URL, this function will be called
-@app.get("/")
-def greet():
+# Declared async def so FastAPI runs it directly on the event loop
+# (plain def endpoints are dispatched through a worker threadpool)
+# The greeting is encoded once at import and returned as plain text, skipping JSON encoding
+# and response validation. A new response object is still built per request: middleware
+# such as CORS edits response headers in place, so a shared instance would leak headers
+# from one request into the next.
+GREETING = b"This is Malay"
+
+@app.get("/", response_class=PlainTextResponse)
+async def greet():
     """
     Root endpoint that returns a simple greeting message.
     This is accessible at: http://localhost:8000/
     """
-    return "This is Malay"
+    return PlainTextResponse(GREETING)
 #run with uvicorn main
 
 # Sample data for database initialization (commented out since now using database)
@@ -53,90 +180,170 @@ def greet():
 
 # Database dependency injection function
 # This function provides a database session to our API endpoints
-def get_db():
+async def get_db():
     """
     Dependency function that provides database sessions to API endpoints.
     Uses dependency injection pattern to manage database connections.
-    Automatically closes the session after use to prevent memory leaks.
+    SessionLocal.begin() opens the session inside a transaction. What it guarantees is
+    cleanup: the transaction is rolled back if the endpoint raises, and the session is
+    always closed afterwards, so no code path can leak a connection.
+    Write endpoints still call `await db.commit()` themselves, so their data is committed
+    before they invalidate the product list cache.
     """
-    db = session()  # Create new database session
-    try:
+    SessionLocal = get_sessionmaker()  # Same factory (and engine/pool) on every call
+    async with SessionLocal.begin() as db:  # Create new database session with an open transaction
         yield db  # Provide session to the endpoint
-    finally:
-        db.close()  # Always close session when done
 
-def init_db():
+# Loader options applied when a full Product object is loaded
+# raiseload('*') makes any accidental lazy load raise an error instead of silently
+# issuing one extra query per row (the N+1 problem). When relationships are added,
+# eager-load them explicitly in front of it, preferring selectinload over joinedload
+# for collections to avoid duplicated rows, e.g.:
+#   (selectinload(db_models.Product.category), raiseload('*'))
+PRODUCT_LOAD_OPTIONS = (raiseload('*'),)
+
+def product_query():
+    """
+    Build the SELECT used to load full Product objects with the shared loader options.
+    Returns:
+        SQLAlchemy Select over the product table
+    """
+    return select(db_models.Product).options(*PRODUCT_LOAD_OPTIONS)
+
+def product_list_query():
+    """
+    Build the SELECT used by the product listing.
+    Only the columns in ProductListItem are fetched, so the description column
+    isn't transferred and no ORM objects are built for the listing.
+    Returns:
+        SQLAlchemy Select over the listed product columns
+    """
+    return select(
+        db_models.Product.id,
+        db_models.Product.name,
+        db_models.Product.price,
+        db_models.Product.quantity,
+    )
+
+async def init_db():
     """
     Initialize the database with sample product data.
     This function adds sample data to the database if it's empty.
-    Only runs on application startup to avoid duplicate entries.
+    Only runs on application startup, and is safe to run from several workers at once.
     """
-    db = session()  # Create a new SQLAlchemy session for database operations
-    
-    try:
-        # Check if the table already has data to avoid duplicate entries
-        existing_count = db.query(db_models.Product).count()
-        
-        if existing_count > 0:
-            print(f"Database already has {existing_count} products. Skipping initialization.")
-            db.close()
-            return
-        
-        print("Initializing database with sample data...")
-        
-        # Sample data to initialize the database
-        sample_products = [
-            {"id": 1, "name": "phone", "description": "samsung", "price": 54000.3, "quantity": 15},
-            {"id": 4, "name": "Laptop", "description": "samsung", "price": 740000, "quantity": 5},
-            {"id": 3, "name": "Charger", "description": "Mobile Charger", "price": 52, "quantity": 32}
-        ]
-        
-        for product_data in sample_products:
-            # Create SQLAlchemy model instance directly from dictionary
-            # ** unpacks the dictionary into keyword arguments
-            db.add(db_models.Product(**product_data))  # Add the SQLAlchemy model to the database session
-        
-        db.commit()  # Commit all changes to the database
-        print("Database initialized successfully!")
+    async with get_sessionmaker()() as db:  # Create a new SQLAlchemy session for database operations
+        try:
+            # Check if the table already has data to avoid duplicate entries
+            # EXISTS stops at the first row instead of scanning the whole table like COUNT(*)
+            result = await db.execute(select(exists().where(db_models.Product.id.is_not(None))))
+            has_any = result.scalar()
+
+            if has_any:
+                print("Database already has products. Skipping initialization.")
+                return
         
-    except Exception as e:
-        print(f"Error initializing database: {e}")
-        db.rollback()  # Rollback changes if there's an error
-    finally:
-        db.close()  # Always close the database session
+            print("Initializing database with sample data...")
+
+            # Sample data to initialize the database
+            sample_products = [
+                {"id": 1, "name": "phone", "description": "samsung", "price": 54000.3, "quantity": 15},
+                {"id": 4, "name": "Laptop", "description": "samsung", "price": 740000, "quantity": 5},
+                {"id": 3, "name": "Charger", "description": "Mobile Charger", "price": 52, "quantity": 32}
+            ]
 
-init_db()
+            # Insert all rows with one Core INSERT executed over the list of dictionaries
+            # The driver batches this into a single multi-row INSERT ... VALUES (...),(...),(...)
+            # and no ORM instance is built per row
+            # ON DUPLICATE KEY UPDATE id = product.id assigns the existing row's id to itself, so a
+            # clash on the id primary key or the unique name leaves that row untouched; workers
+            # racing through the EXISTS check above therefore can't fail on duplicate keys.
+            # (stmt.inserted.id would render VALUES(id) and overwrite the existing row's id.)
+            stmt = mysql_insert(db_models.Product)
+            stmt = stmt.on_duplicate_key_update(id=db_models.Product.id)
+            await db.execute(stmt, sample_products)
+
+            await db.commit()  # Commit all changes to the database
+            print("Database initialized successfully!")
+
+        except Exception as e:
+            print(f"Error initializing database: {e}")
+            await db.rollback()  # Rollback changes if there's an error
+
+# In-process cache for the product list
+# The list is read far more often than it changes, so the serialized JSON is kept in memory.
+# products_version is bumped by every write endpoint, which invalidates the cache immediately
+# in this process; the TTL bounds how stale the list can be after writes handled by other workers.
+PRODUCTS_CACHE_TTL = float(os.environ.get('PRODUCTS_CACHE_TTL', 5))  # Seconds
+product_list_adapter = TypeAdapter(list[ProductListItem])
+app.state.products_version = 0
+app.state.products_cache = None  # (version, created_at, body, etag)
+
+def invalidate_products_cache():
+    """
+    Mark the cached product list as stale after a product was added, updated or deleted.
+    """
+    app.state.products_version += 1
+
+async def load_product_list():
+    """
+    Read the product listing from the database and serialize it to JSON bytes.
+    Only called on a cache miss, so it opens its own short-lived session instead of
+    get_all_products receiving one through Depends(get_db) on every request.
+    Returns:
+        JSON bytes of all products (id, name, price, quantity)
+    """
+    async with get_sessionmaker()() as db:
+        # lambda_stmt caches the built statement by the lambda's code location,
+        # so the SELECT isn't rebuilt and re-keyed for the compiled cache on every request
+        result = await db.execute(lambda_stmt(lambda: product_list_query()))  # Query all products from database
+        products = product_list_adapter.validate_python(result.mappings().all())
+    return product_list_adapter.dump_json(products)
 
 # GET endpoint to retrieve all products from database
-# Uses dependency injection to get database session
+# No database session dependency: a cache hit is a plain memory lookup, and only a miss
+# opens a session (inside load_product_list)
 # Accessible at: http://localhost:8000/products
-@app.get("/products")
-def get_all_products(db: Session = Depends(get_db)):
+@app.get("/products", response_model=list[ProductListItem])
+async def get_all_products(request: Request):
     """
     Retrieve all products from the database.
+    Served from the in-process cache when it's fresh; the response carries an ETag, and a
+    request whose If-None-Match matches it gets an empty 304 Not Modified instead.
     Args:
-        db (Session): Database session injected by FastAPI dependency system
+        request (Request): Incoming request, used to read the If-None-Match header
     Returns:
-        List of all products from database in JSON format
+        List of all products (id, name, price, quantity) from database in JSON format
     """
-    db_products = db.query(db_models.Product).all()  # Query all products from database
-    return db_products
+    version = app.state.products_version
+    cached = app.state.products_cache
+    if cached and cached[0] == version and time.monotonic() - cached[1] < PRODUCTS_CACHE_TTL:
+        body, etag = cached[2], cached[3]
+    else:
+        body = await load_product_list()
+        # The ETag is derived from the content, so it stays valid across workers and restarts
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        app.state.products_cache = (version, time.monotonic(), body, etag)
+
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 # GET endpoint with path parameter to retrieve a specific product by ID from database
 # Path parameter {id} captures the ID from the URL
 # Accessible at: http://localhost:8000/products/id/1 (where 1 is the product ID)
-@app.get('/products/id/{id}')
-def get_product_by_id(id: int, db: Session = Depends(get_db)):
+@app.get('/products/id/{id}', response_model=Union[ProductOut, str])
+async def get_product_by_id(id: int, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific product by its ID from database.
     Args:
         id (int): The unique identifier of the product (path parameter)
-        db (Session): Database session injected by FastAPI dependency system
+        db (AsyncSession): Database session injected by FastAPI dependency system
     Returns:
         Product object if found, error message if not found
     """
-    # Query database for product with specific ID
-    db_product = db.query(db_models.Product).filter(db_models.Product.id == id).first()
+    # Look up the product by primary key
+    # Session.get checks the identity map first and uses a cached primary-key statement
+    db_product = await db.get(db_models.Product, id, options=PRODUCT_LOAD_OPTIONS)
     if db_product:
         return db_product
     return f'Product with id {id} not found, please verify the id, or try by name.'
@@ -162,47 +369,125 @@ def get_product_by_id(id: int, db: Session = Depends(get_db)):
 #     return f'Product named {name} not found, please check the name again, or try with id.'
 
 
+# Upsert statement for products keyed on their unique name
+# The id column is never part of the inserted values: ids are assigned by the database, so the
+# unique name is the only key that can clash and ON DUPLICATE KEY UPDATE always means
+# "a product with this name exists, refresh its price, quantity and description".
+def product_upsert():
+    """
+    Build the INSERT ... ON DUPLICATE KEY UPDATE statement used to create products by name.
+    Returns:
+        MySQL Insert over the product table, executed with id-less product dictionaries
+    """
+    stmt = mysql_insert(db_models.Product)
+    return stmt.on_duplicate_key_update(
+        price=stmt.inserted.price,
+        quantity=stmt.inserted.quantity,
+        description=stmt.inserted.description,
+    )
+
+# Maximum rows sent in one multi-row INSERT, keeping each statement well under MySQL's max_allowed_packet
+# (this limits statement size only; request size is limited by BULK_MAX_PRODUCTS)
+BULK_INSERT_CHUNK_SIZE = 1000
+# Maximum products accepted in one bulk request; larger lists are rejected with 422
+BULK_MAX_PRODUCTS = 10000
+
+# POST endpoint to add many products to database in one request
+# Declared before POST /products/{id} so "bulk" isn't captured as an id
+# Accessible at: http://localhost:8000/products/bulk (with POST method)
+@app.post('/products/bulk', response_model=list[ProductOut])
+async def bulk_add_products(
+    products: list[Product] = Body(max_length=BULK_MAX_PRODUCTS),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Add a list of products to the database in a single transaction.
+    Uses the same upsert as add_product: ids in the body are ignored, and a product whose
+    name already exists has its price, quantity and description updated instead of failing,
+    so retried requests are safe.
+    Rows are written with multi-row INSERT statements of up to BULK_INSERT_CHUNK_SIZE rows,
+    so N products cost a handful of round trips and one commit instead of N of each.
+    Args:
+        products (list[Product]): Up to BULK_MAX_PRODUCTS products in request body, each validated by Pydantic model
+        db (AsyncSession): Database session injected by FastAPI dependency system
+    Returns:
+        The products as stored in the database (with their real ids)
+    """
+    rows = [product.model_dump(exclude={'id'}, exclude_unset=True) for product in products]
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        await db.execute(product_upsert(), rows[start:start + BULK_INSERT_CHUNK_SIZE])
+
+    # Read back the stored rows by name, in chunks to keep each IN (...) list bounded
+    names = list(dict.fromkeys(product.name for product in products))  # Unique names, request order
+    stored = []
+    for start in range(0, len(names), BULK_INSERT_CHUNK_SIZE):
+        result = await db.execute(
+            product_query().where(db_models.Product.name.in_(names[start:start + BULK_INSERT_CHUNK_SIZE]))
+        )
+        stored.extend(result.scalars().all())
+    await db.commit()  # One commit for the whole batch
+    invalidate_products_cache()
+    return stored
+
 # POST endpoint to add a new product to database
 # Uses Pydantic model for automatic request body validation
 # Accessible at: http://localhost:8000/products/{id} (with POST method)
-@app.post('/products/{id}')
-def add_product(product: Product, db: Session = Depends(get_db)):
+@app.post('/products/{id}', response_model=ProductOut)
+async def add_product(product: Product, db: AsyncSession = Depends(get_db)):
     """
-    Add a new product to the database.
+    Add a new product to the database, or update it if one with the same name exists.
+    The id in the request body is ignored; the database assigns ids to new products.
     Args:
         product (Product): Product data in request body, validated by Pydantic model
-        db (Session): Database session injected by FastAPI dependency system
+        db (AsyncSession): Database session injected by FastAPI dependency system
     Returns:
-        The newly added product
+        The product as stored in the database (with its real id)
     """
-    # Convert Pydantic model to SQLAlchemy model and save to database
-    db.add(db_models.Product(**product.model_dump()))
-    db.commit()  # Commit the transaction to save changes
-    return product
+    # Save the product with a single upsert statement
+    # exclude_unset=True passes only the fields present in the request body, and id is left out
+    # so the unique name is the only possible conflict: an existing product with that name is
+    # updated instead of failing, so retried requests don't error and no SELECT-then-INSERT race is possible
+    payload = product.model_dump(exclude={'id'}, exclude_unset=True)
+    await db.execute(product_upsert(), payload)
+    # Read back the stored row so the response shows what is actually in the database
+    result = await db.execute(product_query().where(db_models.Product.name == product.name))
+    db_product = result.scalar_one()
+    await db.commit()  # Commit the transaction to save changes
+    invalidate_products_cache()
+    return db_product
 
 # PUT endpoint to update an existing product in database
 # Requires both ID parameter and product data in request body
 # Accessible at: http://localhost:8000/products/{id} (with PUT method)
-@app.put('/products/{id}')
-def update_product(id: int, product: Product, db: Session = Depends(get_db)):
+@app.put('/products/{id}', response_model=str)
+async def update_product(id: int, product: Product, db: AsyncSession = Depends(get_db)):
     """
     Update an existing product in database by ID.
     Args:
         id (int): ID of the product to update (path parameter)
         product (Product): New product data (request body)
-        db (Session): Database session injected by FastAPI dependency system
+        db (AsyncSession): Database session injected by FastAPI dependency system
     Returns:
         Success message with updated product info, or error if not found
+        or if another product already has the new name
     """
-    # Find the product in database by ID
-    db_product = db.query(db_models.Product).filter(db_models.Product.id == id).first()
-    if db_product:
-        # Update all fields with new data
-        db_product.name = product.name
-        db_product.description = product.description
-        db_product.price = product.price
-        db_product.quantity = product.quantity
-        db.commit()  # Save changes to database
+    # Update all fields with new data in a single UPDATE ... WHERE id = ? statement
+    # No SELECT beforehand: the number of matched rows tells us whether the product exists
+    # synchronize_session=False skips updating objects already loaded in this session (there are none)
+    # Names are unique, so renaming to a name another product already has fails with IntegrityError
+    try:
+        result = await db.execute(
+            update(db_models.Product)
+            .where(db_models.Product.id == id)
+            .values(**product.model_dump(exclude={'id'}, exclude_unset=True))
+            .execution_options(synchronize_session=False)
+        )
+    except IntegrityError:
+        await db.rollback()  # Undo the failed statement
+        return f"A product named {product.name} already exists"
+    await db.commit()  # Save changes to database
+    invalidate_products_cache()
+    if result.rowcount:
         return f"Information for product id: {id} and name: {product.name} updated"
     else:
         return f"No product with id {id} found"
@@ -210,21 +495,26 @@ def update_product(id: int, product: Product, db: Session = Depends(get_db)):
 # DELETE endpoint to remove a product by ID from database
 # Uses path parameter to specify which product to delete
 # Accessible at: http://localhost:8000/products/del_id/{id} (with DELETE method)
-@app.delete('/products/del_id/{id}')
-def delete_product_from_id(id: int, db: Session = Depends(get_db)):
+@app.delete('/products/del_id/{id}', response_model=str)
+async def delete_product_from_id(id: int, db: AsyncSession = Depends(get_db)):
     """
     Delete a product from database using its ID.
     Args:
         id (int): ID of the product to delete (path parameter)
-        db (Session): Database session injected by FastAPI dependency system
+        db (AsyncSession): Database session injected by FastAPI dependency system
     Returns:
         Success message if deleted, error message if not found
     """
-    # Find the product in database by ID
-    db_product = db.query(db_models.Product).filter(db_models.Product.id == id).first()
-    if db_product:
-        db.delete(db_product)  # Delete the product from database
-        db.commit()  # Commit the transaction
+    # Delete the product in a single DELETE ... WHERE id = ? statement
+    # No SELECT beforehand: the number of deleted rows tells us whether the product existed
+    result = await db.execute(
+        delete(db_models.Product)
+        .where(db_models.Product.id == id)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()  # Commit the transaction
+    invalidate_products_cache()
+    if result.rowcount:
         return f"Product with id {id} deleted successfully."
     else:
         return f"Product Not found, please check the {id} again"    
@@ -13,7 +13,7 @@ Pydantic vs SQLAlchemy Models:
 - SQLAlchemy: Database layer operations and table definitions
 """
 
-from pydantic import BaseModel  # Pydantic's BaseModel for data validation and serialization
+from pydantic import BaseModel, ConfigDict  # Pydantic's BaseModel for data validation and serialization
 
 class Product(BaseModel):
     """
@@ -38,6 +38,11 @@ class Product(BaseModel):
     - Documentation: Auto-generates OpenAPI/Swagger documentation
     """
     
+    # Model configuration
+    #   - extra='forbid': Reject request bodies with unknown fields instead of silently dropping them
+    #   - frozen=True: Instances are immutable (and hashable) once validated
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
     # Field definitions with type annotations
     # Pydantic uses these for validation and documentation
     id: int          # Product unique identifier (must be integer, required)
@@ -70,6 +75,7 @@ class Product(BaseModel):
     #
     # 2. JSON Serialization:
     #    - .model_dump() method converts object to dictionary
+    #    - .model_dump(exclude_unset=True) keeps only the fields the client actually sent
     #    - .model_dump_json() method converts object to JSON string
     #
     # 3. JSON Deserialization:
@@ -91,3 +97,30 @@ class Product(BaseModel):
     #    - Nested models for complex data structures
     #    - Field aliases for different naming conventions
 
+
+class ProductOut(Product):
+    """
+    Pydantic model for a full product in API responses.
+
+    Same fields as Product, but from_attributes=True lets FastAPI build it
+    directly from a SQLAlchemy db_models.Product object, so endpoints can
+    return ORM objects and still get typed, Pydantic-speed serialization.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProductListItem(BaseModel):
+    """
+    Pydantic model for one entry of the product listing (GET /products).
+
+    The listing only needs enough to show products in a table, so the
+    description is left out. Used as the endpoint's response_model, FastAPI
+    serializes just these fields, and the query behind it selects only these
+    columns from the database.
+    """
+
+    id: int          # Product unique identifier
+    name: str        # Product name
+    price: float     # Product price
+    quantity: int    # Available quantity
@@ -0,0 +1,116 @@
+"""
+API Tests
+
+This file checks that the product endpoints stay within their SQL query budget,
+so an N+1 query regression (e.g. a lazy-loaded relationship) fails the tests.
+It runs the real application against a temporary SQLite database instead of MySQL:
+1. DATABASE_URL points config.py at SQLite through the aiosqlite driver
+2. DB_QUERY_COUNT turns on the X-DB-Query-Count response header
+3. FastAPI's TestClient runs the app (including its lifespan) in-process
+
+Run with: python -m unittest test
+(requires httpx and aiosqlite: pip install httpx aiosqlite)
+"""
+
+import os        # For setting environment variables before the app is imported
+import tempfile  # For creating a throwaway database file
+import unittest  # Standard library test framework
+
+# Configure the app before importing it: config.py reads these at import time
+DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["DB_QUERY_COUNT"] = "true"
+os.environ["DB_POOL_STATUS_INTERVAL"] = "0"
+
+from sqlalchemy import create_engine, insert  # Synchronous engine used to seed the test database
+from fastapi.testclient import TestClient     # Runs the FastAPI app in-process
+import db_models                               # SQLAlchemy database models
+import main                                    # The FastAPI application under test
+
+# Sample products written before the app starts, so init_db finds data and skips seeding
+# (its MySQL-specific upsert can't run on SQLite)
+SAMPLE_PRODUCTS = [
+    {"id": 1, "name": "phone", "description": "samsung", "price": 54000.3, "quantity": 15},
+    {"id": 3, "name": "Charger", "description": "Mobile Charger", "price": 52, "quantity": 32},
+    {"id": 4, "name": "Laptop", "description": "samsung", "price": 740000, "quantity": 5},
+]
+
+# Maximum SQL queries a product read is allowed to run
+QUERY_BUDGET = 2
+
+# Test client shared by all test classes, started once for the whole module
+client = TestClient(main.app)
+
+
+def setUpModule():
+    # Create the tables and sample rows with a plain synchronous engine
+    seed_engine = create_engine(f"sqlite:///{DB_PATH}")
+    db_models.Base.metadata.create_all(seed_engine)
+    with seed_engine.begin() as conn:
+        conn.execute(insert(db_models.Product), SAMPLE_PRODUCTS)
+    seed_engine.dispose()
+
+    # Entering the client runs the app's lifespan (startup); exiting runs shutdown
+    client.__enter__()
+
+
+def tearDownModule():
+    client.__exit__(None, None, None)
+
+
+class ProductQueryBudgetTest(unittest.TestCase):
+    """
+    Checks the number of SQL queries the product read endpoints run per request.
+    """
+
+    client = client
+
+    def query_count(self, response):
+        """
+        Read the number of SQL queries a request ran from its X-DB-Query-Count header.
+        """
+        return int(response.headers["X-DB-Query-Count"])
+
+    def test_list_products_within_query_budget(self):
+        main.app.state.products_cache = None  # Force a database read instead of a cache hit
+        response = self.client.get("/products")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), len(SAMPLE_PRODUCTS))
+        # At least one query proves the counter is recording; otherwise every budget check passes trivially
+        self.assertGreaterEqual(self.query_count(response), 1)
+        self.assertLessEqual(self.query_count(response), QUERY_BUDGET)
+
+    def test_cached_product_list_runs_no_queries(self):
+        self.client.get("/products")  # Fill the cache
+        response = self.client.get("/products")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.query_count(response), 0)
+
+    def test_get_product_by_id_within_query_budget(self):
+        response = self.client.get("/products/id/1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["name"], "phone")
+        self.assertGreaterEqual(self.query_count(response), 1)
+        self.assertLessEqual(self.query_count(response), QUERY_BUDGET)
+
+
+class ProductUpdateTest(unittest.TestCase):
+    """
+    Checks PUT /products/{id} now that product names are unique.
+    """
+
+    client = client
+
+    def test_rename_to_existing_name_is_rejected(self):
+        response = self.client.put(
+            "/products/1",
+            json={"id": 1, "name": "Laptop", "description": "samsung", "price": 54000.3, "quantity": 15},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), "A product named Laptop already exists")
+        # The product keeps its original name
+        self.assertEqual(self.client.get("/products/id/1").json()["name"], "phone")
+
+
+if __name__ == "__main__":
+    unittest.main()